@@ -7,6 +7,8 @@ import requests
 from urllib.parse import unquote
 from datetime import datetime
 
+JSONP_ARRAY_PATTERN = re.compile(r'\[.*\]')
+
 
 def get_autocomplete_suggestions(query: str) -> list[str]:
     """Fetch suggestions from YouTube autocomplete API."""
@@ -26,7 +28,7 @@ def get_autocomplete_suggestions(query: str) -> list[str]:
         response.raise_for_status()
 
         text = response.text
-        match = re.search(r'\[.*\]', text)
+        match = JSONP_ARRAY_PATTERN.search(text)
         if not match:
             return []
 
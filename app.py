@@ -1,9 +1,5 @@
 """Streamlit Web UI for YouTube SEO Tool"""
 import streamlit as st
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 st.set_page_config(
     page_title="YouTube Keyword Research",
@@ -11,10 +7,23 @@ st.set_page_config(
     layout="wide"
 )
 
-# Import after streamlit config
+# Import after streamlit config (src.utils.config loads .env once per process)
 from src.core.analyzer import KeywordAnalyzer
-from src.core.autocomplete import get_autocomplete_suggestions
-from src.exporters.notion_export import NotionExporter
+from src.core.autocomplete import scrape_autocomplete
+from src.utils.config import config
+
+
+@st.cache_resource
+def _get_analyzer() -> KeywordAnalyzer:
+    """One analyzer (and its HTTP clients), shared across reruns."""
+    return KeywordAnalyzer()
+
+
+@st.cache_data(ttl=3600)
+def _autocomplete(keyword: str) -> list[str]:
+    """Autocomplete suggestions, memoized since every rerun re-requests them."""
+    return [s.keyword for s in scrape_autocomplete(keyword)]
+
 
 st.title("🎯 YouTube Keyword Research Tool")
 st.markdown("*Find content opportunities with Gap Score analysis*")
@@ -44,7 +53,7 @@ st.subheader("💡 Keyword Suggestions")
 autocomplete_input = st.text_input("Get autocomplete suggestions for:", placeholder="defense recruiting")
 if autocomplete_input:
     with st.spinner("Fetching suggestions..."):
-        suggestions = get_autocomplete_suggestions(autocomplete_input)
+        suggestions = _autocomplete(autocomplete_input)
         if suggestions:
             cols = st.columns(4)
             for i, sug in enumerate(suggestions[:12]):
@@ -59,22 +68,28 @@ if analyze_btn and keywords_input:
     if not keywords:
         st.error("Please enter at least one keyword")
     else:
-        analyzer = KeywordAnalyzer(use_cache=use_cache)
+        analyzer = _get_analyzer()
         
         progress = st.progress(0)
         status = st.empty()
         
-        results = []
-        for i, kw in enumerate(keywords):
+        def on_progress(current, total, kw):
             status.text(f"Analyzing: {kw}")
-            progress.progress((i + 1) / len(keywords))
-            
-            try:
-                analysis = analyzer.analyze_keyword(kw, expand=expand_keywords)
-                if analysis:
-                    results.extend(analysis if isinstance(analysis, list) else [analysis])
-            except Exception as e:
-                st.warning(f"Error analyzing '{kw}': {e}")
+            progress.progress(current / total)
+        
+        # The analyzer outlives this run, so its quota counter is a running total
+        quota_before = analyzer.quota_used
+        results = []
+        try:
+            results = analyzer.analyze_keywords(
+                keywords,
+                include_suggestions=expand_keywords,
+                expand_suggestions=expand_keywords,
+                use_cache=use_cache,
+                progress_callback=on_progress,
+            )
+        except Exception as e:
+            st.warning(f"Error analyzing keywords: {e}")
         
         progress.empty()
         status.empty()
@@ -89,17 +104,15 @@ if analyze_btn and keywords_input:
             # Display as table
             data = []
             for r in results:
-                rating_emoji = "🟢" if r.gap_score >= 7 else ("🟡" if r.gap_score >= 4 else "🔴")
-                trend_arrow = {"rising": "↗️", "falling": "↘️", "stable": "→"}.get(r.demand.trend_direction, "→")
                 data.append({
                     "Keyword": r.keyword,
                     "Gap Score": f"{r.gap_score:.1f}",
-                    "Rating": rating_emoji,
-                    "Demand": f"{r.demand.score:.1f}",
-                    "Supply": f"{r.supply.score:.1f}",
-                    "Trend": trend_arrow,
-                    "Videos/30d": r.supply.recent_videos_30d,
-                    "Avg Views": f"{r.supply.avg_views:,.0f}" if r.supply.avg_views else "N/A"
+                    "Rating": r.gap_emoji,
+                    "Demand": f"{r.demand.demand_score:.1f}" if r.demand else "-",
+                    "Supply": f"{r.supply.supply_score:.1f}" if r.supply else "-",
+                    "Trend": r.trend_data.trend_emoji if r.trend_data else "-",
+                    "Videos/30d": r.supply.videos_last_30_days if r.supply else "-",
+                    "Avg Views": f"{r.demand.avg_views_top_10:,.0f}" if r.demand and r.demand.avg_views_top_10 else "N/A"
                 })
             
             st.dataframe(data, use_container_width=True, hide_index=True)
@@ -110,17 +123,13 @@ if analyze_btn and keywords_input:
             
             # Export to Notion
             if export_to_notion:
-                notion_key = os.getenv("NOTION_API_KEY")
-                notion_db = os.getenv("NOTION_DATABASE_ID")
-                
-                if notion_key and notion_db:
+                if config.notion_api_key and config.notion_database_id:
                     with st.spinner("Exporting to Notion..."):
                         try:
-                            exporter = NotionExporter(notion_key, notion_db)
-                            exported = 0
-                            for r in results:
-                                if exporter.export_analysis(r):
-                                    exported += 1
+                            # Imported on demand so idle reruns skip notion_client
+                            from src.exporters.notion_export import NotionExporter
+                            exporter = NotionExporter()
+                            exported = len(exporter.export_multiple(results))
                             st.info(f"✅ Exported {exported} keywords to Notion")
                         except Exception as e:
                             st.error(f"Notion export failed: {e}")
@@ -128,7 +137,7 @@ if analyze_btn and keywords_input:
                     st.warning("Notion credentials not configured")
             
             # Quota info
-            st.caption(f"YouTube API quota used: ~{analyzer.api.quota_used} units")
+            st.caption(f"YouTube API quota used: ~{analyzer.quota_used - quota_before} units")
         else:
             st.warning("No results found")
 
@@ -29,6 +29,9 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={
+        "fast": ["zstandard>=0.21.0"],
+    },
     entry_points={
         "console_scripts": [
             "yt-seo=src.cli:cli",
@@ -11,11 +11,17 @@ from .core.analyzer import KeywordAnalyzer
 from .core.autocomplete import scrape_autocomplete
 from .exporters.csv_export import export_to_csv, generate_csv_filename
 from .exporters.json_export import export_to_json, generate_json_filename
-from .exporters.notion import NotionExporter
+from .data.models import GapScoreRating
 from .utils.config import config
 
 console = Console()
 
+RATING_COLORS = {
+    GapScoreRating.EXCELLENT: "green",
+    GapScoreRating.GOOD: "yellow",
+    GapScoreRating.POOR: "red",
+}
+
 
 @click.group()
 @click.version_option(version="1.0.0")
@@ -182,7 +188,7 @@ def _display_results(results):
     table.add_column("Videos/30d", justify="right")
     
     for r in results:
-        gap_color = "green" if r.gap_score >= 7 else "yellow" if r.gap_score >= 4 else "red"
+        gap_color = RATING_COLORS[r.gap_rating]
         
         table.add_row(
             r.keyword[:40],
@@ -213,6 +219,9 @@ def _export_to_notion(results):
         console.print("[yellow]NOTION_DATABASE_ID not set. Create database first.[/yellow]")
         return
     
+    # Imported here so CSV/JSON runs don't pay for notion_client + httpx
+    from .exporters.notion import NotionExporter
+    
     try:
         exporter = NotionExporter()
         
@@ -1,5 +1,6 @@
 """Main analyzer that combines all data sources for keyword analysis."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import datetime
 
@@ -24,6 +25,10 @@ class KeywordAnalyzer:
     to provide comprehensive keyword analysis with Gap Score.
     """
     
+    # Independent per-keyword lookups (suggestions, supply) that run
+    # alongside the Trends -> demand chain
+    MAX_PARALLEL_LEGS = 2
+    
     def __init__(
         self,
         youtube_api_key: Optional[str] = None,
@@ -48,13 +53,19 @@ class KeywordAnalyzer:
         else:
             self.trends = None
             print("Warning: pytrends not available. Trend data will use defaults.")
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_PARALLEL_LEGS,
+            thread_name_prefix="keyword-analyzer",
+        )
     
     def analyze_keyword(
         self,
         keyword: str,
         include_suggestions: bool = True,
         expand_suggestions: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        top_videos_data: Optional[list[dict]] = None
     ) -> KeywordAnalysis:
         """
         Perform comprehensive analysis on a keyword.
@@ -64,23 +75,38 @@ class KeywordAnalyzer:
             include_suggestions: Whether to fetch autocomplete suggestions
             expand_suggestions: Whether to do prefix/suffix expansion
             use_cache: Whether to use cached results
+            top_videos_data: Top-10 YouTube search results already fetched
+                for this keyword, if any
             
         Returns:
             KeywordAnalysis object with all metrics
         """
         analysis = KeywordAnalysis(keyword=keyword)
         
+        # Suggestions and supply don't depend on anything else, so fetch
+        # them in the background while Trends (which demand needs) runs here
+        suggestions_future = None
+        supply_future = None
+        
         # 1. Get autocomplete suggestions
         if include_suggestions:
             if expand_suggestions:
-                analysis.suggestions = self.autocomplete.expand_suggestions(
-                    keyword, use_cache=use_cache
+                suggestions_future = self._executor.submit(
+                    self.autocomplete.expand_suggestions, keyword, use_cache=use_cache
                 )
             else:
-                analysis.suggestions = self.autocomplete.get_suggestions(
-                    keyword, use_cache=use_cache
+                suggestions_future = self._executor.submit(
+                    self.autocomplete.get_suggestions, keyword, use_cache=use_cache
                 )
         
+        if self.youtube:
+            supply_future = self._executor.submit(
+                self.youtube.analyze_keyword_supply,
+                keyword,
+                use_cache=use_cache,
+                top_videos_data=top_videos_data,
+            )
+        
         # 2. Get Google Trends data
         if self.trends:
             analysis.trend_data = self.trends.get_trend_data(
@@ -101,13 +127,12 @@ class KeywordAnalyzer:
             analysis.demand, analysis.top_videos = self.youtube.analyze_keyword_demand(
                 keyword,
                 trend_index=trend_index,
-                use_cache=use_cache
+                use_cache=use_cache,
+                top_videos_data=top_videos_data,
             )
             
             # 4. Get YouTube supply data
-            analysis.supply = self.youtube.analyze_keyword_supply(
-                keyword, use_cache=use_cache
-            )
+            analysis.supply = supply_future.result()
         else:
             # Minimal data without API
             analysis.demand = DemandMetrics(
@@ -124,6 +149,9 @@ class KeywordAnalyzer:
                 avg_video_age_days=0,
             )
         
+        if suggestions_future:
+            analysis.suggestions = suggestions_future.result()
+        
         return analysis
     
     def analyze_keywords(
@@ -131,7 +159,8 @@ class KeywordAnalyzer:
         keywords: list[str],
         include_suggestions: bool = False,
         use_cache: bool = True,
-        progress_callback=None
+        progress_callback=None,
+        expand_suggestions: bool = False
     ) -> list[KeywordAnalysis]:
         """
         Analyze multiple keywords.
@@ -141,6 +170,7 @@ class KeywordAnalyzer:
             include_suggestions: Whether to fetch suggestions (slower)
             use_cache: Whether to use cached results
             progress_callback: Optional callback function(current, total, keyword)
+            expand_suggestions: Whether to do prefix/suffix expansion
             
         Returns:
             List of KeywordAnalysis objects
@@ -148,6 +178,13 @@ class KeywordAnalyzer:
         results = []
         total = len(keywords)
         
+        # Fetch every keyword's top videos up front so the video/channel
+        # lookups are batched across keywords rather than made per keyword;
+        # the search results are handed on so no keyword is searched twice
+        prefetched = {}
+        if self.youtube and use_cache and total > 1:
+            prefetched = self.youtube.prefetch_top_videos(keywords)
+        
         for i, keyword in enumerate(keywords):
             if progress_callback:
                 progress_callback(i + 1, total, keyword)
@@ -155,7 +192,9 @@ class KeywordAnalyzer:
             analysis = self.analyze_keyword(
                 keyword,
                 include_suggestions=include_suggestions,
-                use_cache=use_cache
+                expand_suggestions=expand_suggestions,
+                use_cache=use_cache,
+                top_videos_data=prefetched.get(keyword),
             )
             results.append(analysis)
         
@@ -10,6 +10,9 @@ from ..data.models import KeywordSuggestion
 from ..data.cache import cache
 from ..utils.rate_limiter import rate_limiters
 
+# The JSON array inside the JSONP wrapper: window.google.ac.h([...])
+JSONP_ARRAY_PATTERN = re.compile(r'\[.*\]')
+
 
 class AutocompleteScraper:
     """
@@ -48,7 +51,7 @@ class AutocompleteScraper:
             text = response.text
             
             # Extract JSON from JSONP: window.google.ac.h(JSON)
-            match = re.search(r'\[.*\]', text)
+            match = JSONP_ARRAY_PATTERN.search(text)
             if not match:
                 return []
             
@@ -79,7 +82,11 @@ class AutocompleteScraper:
         Returns:
             List of KeywordSuggestion objects
         """
-        cache_key = f"{keyword}_{self.language}_{self.region}"
+        # Blank input can't have suggestions; skip the cache and network
+        if not keyword or keyword.isspace():
+            return []
+        
+        cache_key = (keyword, self.language, self.region)
         
         # Check cache
         if use_cache:
@@ -131,43 +138,34 @@ class AutocompleteScraper:
         Returns:
             Combined list of all suggestions (deduplicated)
         """
-        all_suggestions: dict[str, KeywordSuggestion] = {}
-        
         # Characters to use
         chars = list(alphabet)
         if numbers:
             chars.extend([str(i) for i in range(10)])
         
         # Base suggestions
-        for s in self.get_suggestions(keyword, use_cache):
-            all_suggestions[s.keyword.lower()] = s
+        all_suggestions: dict[str, KeywordSuggestion] = {
+            s.keyword.lower(): s for s in self.get_suggestions(keyword, use_cache)
+        }
+        
+        queries = []
         
         # Suffix expansion: "keyword a", "keyword b", etc.
         if suffixes:
-            for char in chars:
-                query = f"{keyword} {char}"
-                for s in self.get_suggestions(query, use_cache):
-                    key = s.keyword.lower()
-                    if key not in all_suggestions:
-                        all_suggestions[key] = s
+            queries.extend(f"{keyword} {char}" for char in chars)
         
         # Prefix expansion: "a keyword", "b keyword", etc.
         if prefixes:
-            for char in chars:
-                query = f"{char} {keyword}"
-                for s in self.get_suggestions(query, use_cache):
-                    key = s.keyword.lower()
-                    if key not in all_suggestions:
-                        all_suggestions[key] = s
+            queries.extend(f"{char} {keyword}" for char in chars)
         
         # Question expansions
         question_words = ["how to", "what is", "why", "best", "top"]
-        for qw in question_words:
-            query = f"{qw} {keyword}"
+        queries.extend(f"{qw} {keyword}" for qw in question_words)
+        
+        # First occurrence of each keyword (case-insensitive) wins
+        for query in queries:
             for s in self.get_suggestions(query, use_cache):
-                key = s.keyword.lower()
-                if key not in all_suggestions:
-                    all_suggestions[key] = s
+                all_suggestions.setdefault(s.keyword.lower(), s)
         
         return list(all_suggestions.values())
     
@@ -191,6 +189,7 @@ class AutocompleteScraper:
         discovered: dict[str, KeywordSuggestion] = {}
         to_process = [keyword]
         processed = set()
+        seed = keyword.lower()
         
         for _ in range(depth):
             next_batch = []
@@ -203,7 +202,7 @@ class AutocompleteScraper:
                 suggestions = self.get_suggestions(kw, use_cache)
                 for s in suggestions:
                     key = s.keyword.lower()
-                    if key not in discovered and key != keyword.lower():
+                    if key not in discovered and key != seed:
                         discovered[key] = s
                         next_batch.append(s.keyword)
             
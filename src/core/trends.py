@@ -68,7 +68,7 @@ class TrendsAPI:
         Returns:
             TrendData object or None if failed
         """
-        cache_key = f"{keyword}_{timeframe}"
+        cache_key = (keyword, timeframe)
         
         if use_cache:
             cached = cache.get("trends", cache_key)
@@ -196,7 +196,7 @@ class TrendsAPI:
         # Check cache first
         uncached = []
         for kw in keywords:
-            cache_key = f"compare_{kw}_{timeframe}"
+            cache_key = (kw, timeframe)
             if use_cache:
                 cached = cache.get("trends_compare", cache_key)
                 if cached:
@@ -270,7 +270,7 @@ class TrendsAPI:
                 results[kw] = trend_data
                 
                 # Cache individual result
-                cache.set("trends_compare", f"compare_{kw}_{timeframe}", {
+                cache.set("trends_compare", (kw, timeframe), {
                     "keyword": trend_data.keyword,
                     "interest_over_time": [
                         (d.isoformat(), v) for d, v in trend_data.interest_over_time
@@ -305,7 +305,7 @@ class TrendsAPI:
         Returns:
             Dictionary with 'top' and 'rising' lists
         """
-        cache_key = f"related_{keyword}"
+        cache_key = keyword
         
         if use_cache:
             cached = cache.get("trends_related", cache_key)
@@ -1,31 +1,94 @@
 """YouTube Data API v3 handler for video and channel data."""
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Optional
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from typing import Callable, Optional, TypeVar
+
+import httpx
 
 from ..data.models import VideoInfo, DemandMetrics, SupplyMetrics
 from ..data.cache import cache
 from ..utils.config import config
 from ..utils.rate_limiter import rate_limiters
 
+# Quota cost per call, see https://developers.google.com/youtube/v3/determine_quota_cost
+SEARCH_QUOTA_COST = 100
+LIST_QUOTA_COST = 1
+
+# Maximum IDs accepted by a single videos/channels list call
+MAX_IDS_PER_REQUEST = 50
+
+T = TypeVar("T")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch(dt: datetime) -> int:
+    """Convert a naive UTC datetime to unix seconds for caching."""
+    return int((dt - _EPOCH).total_seconds())
+
+
+def _from_epoch(ts: int) -> datetime:
+    """Convert cached unix seconds back to a naive UTC datetime."""
+    return _EPOCH + timedelta(seconds=ts)
+
+
+def _parse_published_at(value: str) -> datetime:
+    """Parse an API timestamp into a naive UTC datetime."""
+    # The API uses a fixed 'YYYY-MM-DDTHH:MM:SSZ' layout; slice it directly
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
 
 class YouTubeAPI:
     """
     Handler for YouTube Data API v3.
     
     Manages quota efficiently and provides high-level methods
-    for keyword research.
+    for keyword research. Talks to the REST endpoints directly over a
+    shared HTTP/2 client so independent calls can run concurrently and
+    are multiplexed over one connection.
     """
     
+    BASE_URL = "https://www.googleapis.com/youtube/v3"
+    
+    # Upper bound on simultaneous outbound requests per instance
+    MAX_CONCURRENT_REQUESTS = 10
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or config.youtube_api_key
         if not self.api_key:
             raise ValueError("YouTube API key is required. Set YOUTUBE_API_KEY in .env")
         
-        self.youtube = build("youtube", "v3", developerKey=self.api_key)
+        # Persistent HTTP/2 client: concurrent requests share one TLS
+        # connection instead of each paying a handshake
+        self.client = httpx.Client(
+            http2=True,
+            base_url=self.BASE_URL,
+            params={"key": self.api_key},
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=self.MAX_CONCURRENT_REQUESTS,
+            ),
+            timeout=30,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix="youtube-api",
+        )
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._quota_lock = threading.Lock()
         self._quota_used = 0
+        
+        # Requests currently being fetched, shared with concurrent callers
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     @property
     def quota_used(self) -> int:
@@ -34,7 +97,48 @@ class YouTubeAPI:
     
     def _track_quota(self, units: int):
         """Track quota usage."""
-        self._quota_used += units
+        with self._quota_lock:
+            self._quota_used += units
+    
+    def _get(self, resource: str, params: dict) -> dict:
+        """
+        Call a Data API resource and return the decoded response.
+        
+        Raises:
+            httpx.HTTPError: On network or HTTP errors
+        """
+        with self._request_slots:
+            response = self.client.get(f"/{resource}", params=params)
+        response.raise_for_status()
+        return response.json()
+    
+    def _single_flight(self, key: tuple, fetch: Callable[[], T]) -> T:
+        """
+        Run fetch once for all concurrent callers asking for the same key.
+        
+        Callers arriving while a fetch for the key is in flight wait for
+        and share its result instead of spending quota on a duplicate call.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
     
     def search_videos(
         self,
@@ -61,53 +165,64 @@ class YouTubeAPI:
             
         Quota cost: 100 units per call
         """
-        cache_key = f"{keyword}_{order}_{max_results}_{published_after}_{published_before}"
+        cache_key = (
+            keyword,
+            order,
+            max_results,
+            _to_epoch(published_after) if published_after else None,
+            _to_epoch(published_before) if published_before else None,
+        )
         
         if use_cache:
             cached = cache.get("search", cache_key)
             if cached:
                 return cached
         
-        rate_limiters.wait("youtube")
+        request_params = {
+            "q": keyword,
+            "part": "snippet",
+            "type": "video",
+            "maxResults": min(max_results, 50),
+            "order": order,
+        }
+        
+        if published_after:
+            request_params["publishedAfter"] = published_after.isoformat() + "Z"
+        if published_before:
+            request_params["publishedBefore"] = published_before.isoformat() + "Z"
+        
+        return self._single_flight(
+            ("search", cache_key),
+            lambda: self._fetch_search(cache_key, request_params),
+        )
+    
+    def _fetch_search(self, cache_key: tuple, request_params: dict) -> list[dict]:
+        """Run a search request and cache its results."""
+        rate_limiters.wait("youtube", SEARCH_QUOTA_COST)
         
         try:
-            request_params = {
-                "q": keyword,
-                "part": "snippet",
-                "type": "video",
-                "maxResults": min(max_results, 50),
-                "order": order,
-            }
-            
-            if published_after:
-                request_params["publishedAfter"] = published_after.isoformat() + "Z"
-            if published_before:
-                request_params["publishedBefore"] = published_before.isoformat() + "Z"
-            
-            request = self.youtube.search().list(**request_params)
-            response = request.execute()
-            
-            self._track_quota(100)
-            
-            videos = []
-            for item in response.get("items", []):
-                videos.append({
-                    "video_id": item["id"]["videoId"],
-                    "title": item["snippet"]["title"],
-                    "channel_id": item["snippet"]["channelId"],
-                    "channel_title": item["snippet"]["channelTitle"],
-                    "published_at": item["snippet"]["publishedAt"],
-                    "description": item["snippet"].get("description", ""),
-                })
-            
-            if videos:
-                cache.set("search", cache_key, videos, ttl_hours=12)
-            
-            return videos
-            
-        except HttpError as e:
+            response = self._get("search", request_params)
+        except httpx.HTTPError as e:
             print(f"YouTube API error: {e}")
             return []
+        
+        self._track_quota(SEARCH_QUOTA_COST)
+        
+        videos = []
+        for item in response.get("items", []):
+            videos.append({
+                "video_id": item["id"]["videoId"],
+                "title": item["snippet"]["title"],
+                "channel_id": item["snippet"]["channelId"],
+                "channel_title": item["snippet"]["channelTitle"],
+                "published_at": item["snippet"]["publishedAt"],
+                "description": item["snippet"].get("description", ""),
+            })
+        
+        if videos:
+            cache.set("search", cache_key, videos, ttl_hours=12)
+        
+        return videos
     
     def get_video_details(
         self,
@@ -124,7 +239,7 @@ class YouTubeAPI:
         Returns:
             List of VideoInfo objects
             
-        Quota cost: 1 unit per call (can batch up to 50)
+        Quota cost: 1 unit per 50 IDs
         """
         # Check cache first
         results = []
@@ -134,61 +249,73 @@ class YouTubeAPI:
             if use_cache:
                 cached = cache.get("video", vid)
                 if cached:
-                    results.append(VideoInfo(**cached))
+                    results.append(VideoInfo(**{
+                        **cached,
+                        "published_at": _from_epoch(cached["published_at"]),
+                    }))
                     continue
             uncached_ids.append(vid)
         
         if not uncached_ids:
             return results
         
-        rate_limiters.wait("youtube")
+        for start in range(0, len(uncached_ids), MAX_IDS_PER_REQUEST):
+            batch = uncached_ids[start:start + MAX_IDS_PER_REQUEST]
+            results.extend(self._single_flight(
+                ("videos", *sorted(batch)),
+                lambda: self._fetch_video_batch(batch),
+            ))
+        
+        return results
+    
+    def _fetch_video_batch(self, video_ids: list[str]) -> list[VideoInfo]:
+        """Fetch up to 50 videos in one request and cache them individually."""
+        rate_limiters.wait("youtube", LIST_QUOTA_COST)
         
         try:
-            # Batch request (up to 50 IDs)
-            request = self.youtube.videos().list(
-                part="snippet,statistics",
-                id=",".join(uncached_ids[:50])
-            )
-            response = request.execute()
-            
-            self._track_quota(1)
-            
-            for item in response.get("items", []):
-                stats = item.get("statistics", {})
-                snippet = item.get("snippet", {})
-                
-                video_info = VideoInfo(
-                    video_id=item["id"],
-                    title=snippet.get("title", ""),
-                    channel_id=snippet.get("channelId", ""),
-                    channel_title=snippet.get("channelTitle", ""),
-                    published_at=datetime.fromisoformat(
-                        snippet.get("publishedAt", "").replace("Z", "+00:00")
-                    ).replace(tzinfo=None),
-                    view_count=int(stats.get("viewCount", 0)),
-                    like_count=int(stats.get("likeCount", 0)),
-                    comment_count=int(stats.get("commentCount", 0)),
-                )
-                
-                results.append(video_info)
-                
-                # Cache individual video
-                cache.set("video", item["id"], {
-                    "video_id": video_info.video_id,
-                    "title": video_info.title,
-                    "channel_id": video_info.channel_id,
-                    "channel_title": video_info.channel_title,
-                    "published_at": video_info.published_at.isoformat(),
-                    "view_count": video_info.view_count,
-                    "like_count": video_info.like_count,
-                    "comment_count": video_info.comment_count,
-                })
+            response = self._get("videos", {
+                "part": "snippet,statistics",
+                "id": ",".join(video_ids),
+            })
+        except httpx.HTTPError as e:
+            print(f"YouTube API error: {e}")
+            return []
+        
+        self._track_quota(LIST_QUOTA_COST)
+        
+        videos = []
+        to_cache = []
+        for item in response.get("items", []):
+            stats = item.get("statistics", {})
+            snippet = item.get("snippet", {})
             
-            return results
+            video_info = VideoInfo(
+                video_id=item["id"],
+                title=snippet.get("title", ""),
+                channel_id=snippet.get("channelId", ""),
+                channel_title=snippet.get("channelTitle", ""),
+                published_at=_parse_published_at(snippet.get("publishedAt", "")),
+                view_count=int(stats.get("viewCount", 0)),
+                like_count=int(stats.get("likeCount", 0)),
+                comment_count=int(stats.get("commentCount", 0)),
+            )
             
-        except HttpError as e:
-            print(f"YouTube API error: {e}")
-            return results
+            videos.append(video_info)
+            to_cache.append((item["id"], {
+                "video_id": video_info.video_id,
+                "title": video_info.title,
+                "channel_id": video_info.channel_id,
+                "channel_title": video_info.channel_title,
+                "published_at": _to_epoch(video_info.published_at),
+                "view_count": video_info.view_count,
+                "like_count": video_info.like_count,
+                "comment_count": video_info.comment_count,
+            }))
+        
+        # Cache each video individually, in one transaction
+        cache.set_many("video", to_cache)
+        
+        return videos
     
     def get_channel_subscribers(
         self,
@@ -205,7 +332,7 @@ class YouTubeAPI:
         Returns:
             Dictionary mapping channel_id to subscriber count
             
-        Quota cost: 1 unit per call
+        Quota cost: 1 unit per 50 IDs
         """
         results = {}
         uncached_ids = []
@@ -221,37 +348,78 @@ class YouTubeAPI:
         if not uncached_ids:
             return results
         
-        rate_limiters.wait("youtube")
+        # Deduplicate, keeping order
+        unique_ids = list(dict.fromkeys(uncached_ids))
+        
+        for start in range(0, len(unique_ids), MAX_IDS_PER_REQUEST):
+            batch = unique_ids[start:start + MAX_IDS_PER_REQUEST]
+            results.update(self._single_flight(
+                ("channels", *sorted(batch)),
+                lambda: self._fetch_channel_batch(batch),
+            ))
+        
+        return results
+    
+    def _fetch_channel_batch(self, channel_ids: list[str]) -> dict[str, int]:
+        """Fetch subscriber counts for up to 50 channels in one request."""
+        rate_limiters.wait("youtube", LIST_QUOTA_COST)
         
         try:
-            # Deduplicate
-            unique_ids = list(set(uncached_ids))[:50]
-            
-            request = self.youtube.channels().list(
-                part="statistics",
-                id=",".join(unique_ids)
-            )
-            response = request.execute()
-            
-            self._track_quota(1)
-            
-            for item in response.get("items", []):
-                channel_id = item["id"]
-                subs = int(item.get("statistics", {}).get("subscriberCount", 0))
-                results[channel_id] = subs
-                cache.set("channel_subs", channel_id, subs, ttl_hours=48)
-            
-            return results
-            
-        except HttpError as e:
+            response = self._get("channels", {
+                "part": "statistics",
+                "id": ",".join(channel_ids),
+            })
+        except httpx.HTTPError as e:
             print(f"YouTube API error: {e}")
-            return results
+            return {}
+        
+        self._track_quota(LIST_QUOTA_COST)
+        
+        subscribers = {}
+        for item in response.get("items", []):
+            channel_id = item["id"]
+            subs = int(item.get("statistics", {}).get("subscriberCount", 0))
+            subscribers[channel_id] = subs
+        
+        cache.set_many("channel_subs", list(subscribers.items()), ttl_hours=48)
+        
+        return subscribers
+    
+    def prefetch_top_videos(self, keywords: list[str]) -> dict[str, list[dict]]:
+        """
+        Warm the cache with the top videos and their channels for many keywords.
+        
+        Video and channel lookups are pooled across all keywords so they go
+        out in full batches of 50 IDs instead of one small call per keyword.
+        Later per-keyword calls with use_cache=True are then served from cache.
+        
+        Args:
+            keywords: Keywords that are about to be analyzed
+            
+        Returns:
+            Top-10 search results per keyword (empty when the search found
+            nothing or failed), to pass on as `top_videos_data` so those
+            keywords aren't searched again
+        """
+        searches = dict(zip(keywords, self._executor.map(
+            lambda kw: self.search_videos(kw, max_results=10, order="relevance"),
+            keywords,
+        )))
+        video_ids = list(dict.fromkeys(
+            v["video_id"] for videos in searches.values() for v in videos
+        ))
+        if video_ids:
+            videos = self.get_video_details(video_ids)
+            self.get_channel_subscribers([v.channel_id for v in videos])
+        
+        return searches
     
     def analyze_keyword_supply(
         self,
         keyword: str,
         days: int = 30,
-        use_cache: bool = True
+        use_cache: bool = True,
+        top_videos_data: Optional[list[dict]] = None
     ) -> SupplyMetrics:
         """
         Analyze the supply side for a keyword.
@@ -262,66 +430,85 @@ class YouTubeAPI:
             keyword: The keyword to analyze
             days: How many days to look back
             use_cache: Whether to use cached results
+            top_videos_data: Top-10 search results already fetched (e.g. by
+                prefetch_top_videos); searched for when None
             
         Returns:
             SupplyMetrics object
         """
-        cache_key = f"supply_{keyword}_{days}"
+        cache_key = (keyword, days)
         
         if use_cache:
             cached = cache.get("supply", cache_key)
             if cached:
                 return SupplyMetrics(**cached)
         
-        now = datetime.utcnow()
+        # Truncate to the hour so the date-filtered searches share a cache
+        # key (and a publishedAfter string) for every call within that hour
+        now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        window_30d = now - timedelta(days=30)
+        window_7d = now - timedelta(days=7)
         
+        # The upload-volume searches only feed the counts, so run them in
+        # the background while the top-10 chain below proceeds
         # Videos in last 30 days
-        videos_30d = self.search_videos(
+        future_30d = self._executor.submit(
+            self.search_videos,
             keyword,
             max_results=50,
             order="date",
-            published_after=now - timedelta(days=30),
+            published_after=window_30d,
             use_cache=use_cache
         )
         
         # Videos in last 7 days
-        videos_7d = self.search_videos(
+        future_7d = self._executor.submit(
+            self.search_videos,
             keyword,
             max_results=50,
             order="date",
-            published_after=now - timedelta(days=7),
+            published_after=window_7d,
             use_cache=use_cache
         )
         
         # Get top 10 by relevance for competition analysis
-        top_videos_data = self.search_videos(
-            keyword,
-            max_results=10,
-            order="relevance",
-            use_cache=use_cache
-        )
+        if top_videos_data is None:
+            top_videos_data = self.search_videos(
+                keyword,
+                max_results=10,
+                order="relevance",
+                use_cache=use_cache
+            )
         
+        top_videos = []
         if top_videos_data:
             video_ids = [v["video_id"] for v in top_videos_data]
             top_videos = self.get_video_details(video_ids, use_cache)
-            
+        
+        if top_videos:
             # Get channel subscribers
             channel_ids = list(set(v.channel_id for v in top_videos))
             subs = self.get_channel_subscribers(channel_ids, use_cache)
             
             # Add subscriber info to videos
-            for video in top_videos:
-                video.subscriber_count = subs.get(video.channel_id, 0)
+            top_videos = [
+                replace(video, subscriber_count=subs.get(video.channel_id, 0))
+                for video in top_videos
+            ]
             
-            # Calculate metrics
+            # Calculate metrics (ages against one clock read)
+            as_of = datetime.now()
             avg_subs = sum(v.subscriber_count or 0 for v in top_videos) / len(top_videos)
             small_channels = sum(1 for v in top_videos if (v.subscriber_count or 0) < 10000)
-            avg_age = sum(v.age_days for v in top_videos) / len(top_videos)
+            avg_age = sum(v.age_days_at(as_of) for v in top_videos) / len(top_videos)
         else:
             avg_subs = 0
             small_channels = 0
             avg_age = 0
         
+        videos_30d = future_30d.result()
+        videos_7d = future_7d.result()
+        
         metrics = SupplyMetrics(
             videos_last_30_days=len(videos_30d),
             videos_last_7_days=len(videos_7d),
@@ -345,7 +532,8 @@ class YouTubeAPI:
         self,
         keyword: str,
         trend_index: float = 50.0,
-        use_cache: bool = True
+        use_cache: bool = True,
+        top_videos_data: Optional[list[dict]] = None
     ) -> tuple[DemandMetrics, list[VideoInfo]]:
         """
         Analyze the demand side for a keyword.
@@ -354,17 +542,20 @@ class YouTubeAPI:
             keyword: The keyword to analyze
             trend_index: Google Trends index (0-100), passed in from Trends module
             use_cache: Whether to use cached results
+            top_videos_data: Top-10 search results already fetched (e.g. by
+                prefetch_top_videos); searched for when None
             
         Returns:
             Tuple of (DemandMetrics, list of top videos)
         """
         # Get top 10 videos by relevance
-        top_videos_data = self.search_videos(
-            keyword,
-            max_results=10,
-            order="relevance",
-            use_cache=use_cache
-        )
+        if top_videos_data is None:
+            top_videos_data = self.search_videos(
+                keyword,
+                max_results=10,
+                order="relevance",
+                use_cache=use_cache
+            )
         
         if not top_videos_data:
             return DemandMetrics(
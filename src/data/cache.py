@@ -1,93 +1,215 @@
 """SQLite caching for API responses."""
 
-import json
+import hashlib
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Any
-from contextlib import contextmanager
+from typing import Optional, Any, Union
+
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(
+            value, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), default=str).encode()
+
+    _loads = json.loads
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 from ..utils.config import config, get_cache_path
 
+# Bump when the table layout or value encoding changes; older cache
+# databases are dropped and rebuilt on open
+SCHEMA_VERSION = 4
+
+# Stored values carry a one-byte prefix saying how the rest is encoded
+_RAW = b"\x00"
+_ZSTD = b"\x01"
+
+# Payloads above this size are zstd-compressed (search results mostly)
+COMPRESS_MIN_BYTES = 1024
+
+# A plain ID, or a tuple of str/int/None parts for composite lookups
+Identifier = Union[str, tuple]
+
+# Marks a miss in the memory layer (None is a valid cached value)
+_MISS = object()
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a value, compressing it when it is large enough to pay off."""
+    data = _dumps(value)
+    if ZSTD_AVAILABLE and len(data) > COMPRESS_MIN_BYTES:
+        return _ZSTD + zstandard.ZstdCompressor(level=3).compress(data)
+    return _RAW + data
+
+
+def _decode(blob: bytes) -> Any:
+    """Inverse of _encode. Returns _MISS if the row cannot be decoded here."""
+    prefix, data = blob[:1], blob[1:]
+    if prefix == _ZSTD:
+        if not ZSTD_AVAILABLE:
+            return _MISS
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return _loads(data)
+
 
 class Cache:
-    """SQLite-based cache for API responses."""
+    """
+    SQLite-based cache for API responses.
+    
+    Each thread keeps one open connection in autocommit mode; the database
+    runs in WAL mode so readers never block on a concurrent writer.
+    
+    Recently used entries are also kept in a bounded in-process LRU so
+    repeated hits skip SQLite and deserialization entirely. Values returned
+    from the cache are shared and must be treated as read-only.
+    """
+    
+    # Max entries held in the in-process layer
+    MEMORY_CAPACITY = 2048
+    
+    # Minimum seconds between sweeps of expired rows, run from set()
+    SWEEP_INTERVAL_SECONDS = 300
     
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or get_cache_path()
+        self._local = threading.local()
+        self._mem: OrderedDict[bytes, tuple[Any, float]] = OrderedDict()
+        self._mem_lock = threading.Lock()
+        # The first write sweeps, so short CLI runs prune expired rows too
+        self._last_sweep = float("-inf")
         self._init_db()
     
     def _init_db(self):
         """Initialize the database schema."""
-        with self._get_connection() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL,
-                    cache_type TEXT DEFAULT 'general'
-                )
-            """)
+        conn = self._get_connection()
+        
+        # Persistent setting, stored in the database file
+        conn.execute("PRAGMA journal_mode=WAL")
+        
+        # Cached data is disposable, so format changes just start over
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS cache")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key BLOB PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at TIMESTAMP NOT NULL,
+                cache_type TEXT DEFAULT 'general'
+            )
+        """)
+        
+        # Index for faster expiry checks
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_expires_at ON cache(expires_at)
+        """)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,  # Autocommit
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+    
+    def _make_key(self, cache_type: str, identifier: Identifier) -> bytes:
+        """Create a fixed-size 16-byte cache key by hashing type and identifier."""
+        return hashlib.blake2b(
+            repr((cache_type, identifier)).encode(), digest_size=16
+        ).digest()
+    
+    def _mem_get(self, key: bytes) -> Any:
+        """Look up a key in the memory layer, returning _MISS if absent or expired."""
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return _MISS
             
-            # Index for faster expiry checks
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires_at ON cache(expires_at)
-            """)
+            value, expires = entry
+            if time.monotonic() >= expires:
+                del self._mem[key]
+                return _MISS
             
-            conn.commit()
-    
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+            self._mem.move_to_end(key)
+            return value
     
-    def _make_key(self, cache_type: str, identifier: str) -> str:
-        """Create a cache key."""
-        return f"{cache_type}:{identifier}"
+    def _mem_put(self, key: bytes, value: Any, ttl_seconds: float):
+        """Store a value in the memory layer, evicting the least recently used."""
+        with self._mem_lock:
+            self._mem[key] = (value, time.monotonic() + ttl_seconds)
+            self._mem.move_to_end(key)
+            if len(self._mem) > self.MEMORY_CAPACITY:
+                self._mem.popitem(last=False)
     
-    def get(self, cache_type: str, identifier: str) -> Optional[Any]:
+    def get(self, cache_type: str, identifier: Identifier) -> Optional[Any]:
         """
         Get a value from cache.
         
         Args:
             cache_type: Type of cached data (e.g., 'autocomplete', 'video', 'trends')
-            identifier: Unique identifier for the data
+            identifier: Unique identifier for the data (string or tuple of parts)
             
         Returns:
             Cached value or None if not found/expired
         """
         key = self._make_key(cache_type, identifier)
         
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT value, expires_at FROM cache WHERE key = ?",
-                (key,)
-            )
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
-            
-            # Check expiration
-            expires_at = datetime.fromisoformat(row["expires_at"])
-            if datetime.now() > expires_at:
-                # Expired, delete it
-                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                conn.commit()
-                return None
-            
-            return json.loads(row["value"])
+        value = self._mem_get(key)
+        if value is not _MISS:
+            return value
+        
+        conn = self._get_connection()
+        
+        # Expired rows are simply not matched; writes sweep them periodically
+        now = datetime.now()
+        cursor = conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+            (key, now.isoformat())
+        )
+        row = cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        remaining = (datetime.fromisoformat(row["expires_at"]) - now).total_seconds()
+        value = _decode(row["value"])
+        if value is _MISS:
+            return None
+        self._mem_put(key, value, remaining)
+        return value
     
     def set(
         self,
         cache_type: str,
-        identifier: str,
+        identifier: Identifier,
         value: Any,
         ttl_hours: Optional[int] = None
     ):
@@ -96,75 +218,131 @@ class Cache:
         
         Args:
             cache_type: Type of cached data
-            identifier: Unique identifier
-            value: Value to cache (must be JSON serializable)
+            identifier: Unique identifier (string or tuple of parts)
+            value: Value to cache (plain dicts, lists, strings and numbers)
             ttl_hours: Time to live in hours (uses config default if not specified)
         """
         key = self._make_key(cache_type, identifier)
         ttl = ttl_hours or config.cache_ttl_hours
         expires_at = datetime.now() + timedelta(hours=ttl)
         
-        with self._get_connection() as conn:
-            conn.execute(
+        self._get_connection().execute(
+            """
+            INSERT OR REPLACE INTO cache (key, value, expires_at, cache_type)
+            VALUES (?, ?, ?, ?)
+            """,
+            (key, _encode(value), expires_at.isoformat(), cache_type)
+        )
+        self._mem_put(key, value, ttl * 3600)
+        self._maybe_sweep()
+    
+    def set_many(
+        self,
+        cache_type: str,
+        items: list[tuple[Identifier, Any]],
+        ttl_hours: Optional[int] = None
+    ):
+        """
+        Set several values of one type in a single transaction.
+        
+        Args:
+            cache_type: Type of cached data
+            items: (identifier, value) pairs
+            ttl_hours: Time to live in hours (uses config default if not specified)
+        """
+        if not items:
+            return
+        
+        ttl = ttl_hours or config.cache_ttl_hours
+        expires_at = (datetime.now() + timedelta(hours=ttl)).isoformat()
+        rows = [
+            (self._make_key(cache_type, identifier), _encode(value), expires_at, cache_type)
+            for identifier, value in items
+        ]
+        
+        conn = self._get_connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO cache (key, value, expires_at, cache_type)
                 VALUES (?, ?, ?, ?)
                 """,
-                (key, json.dumps(value), expires_at.isoformat(), cache_type)
+                rows
             )
-            conn.commit()
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        
+        for (key, _, _, _), (_, value) in zip(rows, items):
+            self._mem_put(key, value, ttl * 3600)
+        self._maybe_sweep()
     
-    def delete(self, cache_type: str, identifier: str):
+    def _maybe_sweep(self):
+        """Clear expired rows if the last sweep is older than the sweep interval."""
+        if time.monotonic() - self._last_sweep > self.SWEEP_INTERVAL_SECONDS:
+            self._last_sweep = time.monotonic()
+            self.clear_expired()
+    
+    def delete(self, cache_type: str, identifier: Identifier):
         """Delete a specific cache entry."""
         key = self._make_key(cache_type, identifier)
         
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-            conn.commit()
+        self._get_connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        
+        with self._mem_lock:
+            self._mem.pop(key, None)
     
     def clear_type(self, cache_type: str):
         """Clear all entries of a specific type."""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM cache WHERE cache_type = ?", (cache_type,))
-            conn.commit()
+        self._get_connection().execute(
+            "DELETE FROM cache WHERE cache_type = ?", (cache_type,)
+        )
+        
+        # Rare operation, simply drop the whole memory layer
+        with self._mem_lock:
+            self._mem.clear()
     
     def clear_expired(self):
         """Remove all expired entries."""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM cache WHERE expires_at < ?", (datetime.now().isoformat(),))
-            conn.commit()
+        self._get_connection().execute(
+            "DELETE FROM cache WHERE expires_at < ?", (datetime.now().isoformat(),)
+        )
     
     def clear_all(self):
         """Clear entire cache."""
-        with self._get_connection() as conn:
-            conn.execute("DELETE FROM cache")
-            conn.commit()
+        self._get_connection().execute("DELETE FROM cache")
+        
+        with self._mem_lock:
+            self._mem.clear()
     
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        with self._get_connection() as conn:
-            # Total entries
-            total = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
-            
-            # By type
-            by_type = {}
-            cursor = conn.execute(
-                "SELECT cache_type, COUNT(*) as count FROM cache GROUP BY cache_type"
-            )
-            for row in cursor:
-                by_type[row["cache_type"]] = row["count"]
-            
-            # Expired count
-            expired = conn.execute(
-                "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
-                (datetime.now().isoformat(),)
-            ).fetchone()[0]
-            
-            return {
-                "total_entries": total,
-                "by_type": by_type,
-                "expired_entries": expired,
-            }
+        conn = self._get_connection()
+        
+        # Total entries
+        total = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        
+        # By type
+        by_type = {}
+        cursor = conn.execute(
+            "SELECT cache_type, COUNT(*) as count FROM cache GROUP BY cache_type"
+        )
+        for row in cursor:
+            by_type[row["cache_type"]] = row["count"]
+        
+        # Expired count
+        expired = conn.execute(
+            "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
+            (datetime.now().isoformat(),)
+        ).fetchone()[0]
+        
+        return {
+            "total_entries": total,
+            "by_type": by_type,
+            "expired_entries": expired,
+        }
 
 
 # Global cache instance
@@ -1,5 +1,6 @@
 """Data models for YouTube SEO Tool."""
 
+from math import log10 as _log10
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -11,9 +12,30 @@ class GapScoreRating(Enum):
     EXCELLENT = "excellent"  # > 7
     GOOD = "good"           # 4-7
     POOR = "poor"           # < 4
+    
+    @classmethod
+    def for_score(cls, score: float) -> "GapScoreRating":
+        """Get the rating category for a gap score."""
+        if score >= 7:
+            return cls.EXCELLENT
+        elif score >= 4:
+            return cls.GOOD
+        return cls.POOR
+    
+    @property
+    def emoji(self) -> str:
+        """Traffic-light emoji for this rating."""
+        return _RATING_EMOJI[self]
+
 
+_RATING_EMOJI = {
+    GapScoreRating.EXCELLENT: "🟢",
+    GapScoreRating.GOOD: "🟡",
+    GapScoreRating.POOR: "🔴",
+}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class VideoInfo:
     """Information about a YouTube video."""
     
@@ -37,17 +59,26 @@ class VideoInfo:
     @property
     def age_days(self) -> int:
         """Get video age in days."""
-        return (datetime.now() - self.published_at).days
+        return self.age_days_at(datetime.now())
+    
+    def age_days_at(self, now: datetime) -> int:
+        """Get video age in days as of `now` (share one `now` across a batch)."""
+        return (now - self.published_at).days
     
     @property
     def views_per_day(self) -> float:
         """Calculate average views per day."""
-        if self.age_days == 0:
+        return self.views_per_day_at(datetime.now())
+    
+    def views_per_day_at(self, now: datetime) -> float:
+        """Calculate average views per day as of `now`."""
+        age = self.age_days_at(now)
+        if age == 0:
             return float(self.view_count)
-        return self.view_count / self.age_days
+        return self.view_count / age
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordSuggestion:
     """A keyword suggestion from autocomplete."""
     
@@ -56,7 +87,7 @@ class KeywordSuggestion:
     source: str = "youtube_autocomplete"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrendData:
     """Google Trends data for a keyword."""
     
@@ -86,7 +117,7 @@ class TrendData:
         return "→"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemandMetrics:
     """Demand-side metrics for a keyword."""
     
@@ -95,24 +126,21 @@ class DemandMetrics:
     total_views_top_10: int
     avg_engagement_rate: float
     
-    @property
-    def demand_score(self) -> float:
-        """
-        Calculate demand score (0-10).
-        
-        Combines trend index and view potential.
-        """
+    # Demand score (0-10), combines trend index and view potential.
+    # Computed once on construction since instances are immutable.
+    demand_score: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
         # Normalize views (log scale, cap at 10M)
-        import math
-        view_score = min(10, math.log10(max(1, self.avg_views_top_10)) / 7 * 10)
+        view_score = min(10, _log10(max(1, self.avg_views_top_10)) / 7 * 10)
         
         # Combine with trend
         trend_score = self.trend_index / 10
         
-        return (trend_score * 0.4 + view_score * 0.6)
+        object.__setattr__(self, "demand_score", trend_score * 0.4 + view_score * 0.6)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SupplyMetrics:
     """Supply-side metrics for a keyword."""
     
@@ -122,22 +150,18 @@ class SupplyMetrics:
     small_channels_in_top_10: int  # Channels with < 10k subs
     avg_video_age_days: float
     
-    @property
-    def supply_score(self) -> float:
-        """
-        Calculate supply score (0-10).
-        
-        Higher score = more saturated market.
-        """
-        import math
-        
+    # Supply score (0-10), higher score = more saturated market.
+    # Computed once on construction since instances are immutable.
+    supply_score: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
         # Video volume score (log scale)
-        volume_score = min(10, math.log10(max(1, self.videos_last_30_days + 1)) * 3)
+        volume_score = min(10, _log10(max(1, self.videos_last_30_days + 1)) * 3)
         
         # Channel size score
-        channel_score = min(10, math.log10(max(1, self.avg_channel_subscribers)) / 6 * 10)
+        channel_score = min(10, _log10(max(1, self.avg_channel_subscribers)) / 6 * 10)
         
-        return (volume_score * 0.5 + channel_score * 0.5)
+        object.__setattr__(self, "supply_score", volume_score * 0.5 + channel_score * 0.5)
     
     @property
     def has_small_channel_wins(self) -> bool:
@@ -150,7 +174,7 @@ class SupplyMetrics:
         return self.avg_video_age_days > 365  # Older than 1 year
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordAnalysis:
     """Complete analysis for a keyword."""
     
@@ -162,6 +186,18 @@ class KeywordAnalysis:
     supply: Optional[SupplyMetrics] = None
     analyzed_at: datetime = field(default_factory=datetime.now)
     
+    # Memoized derived values, reset whenever a public field is reassigned.
+    # They only read trend_data/demand/supply, which are frozen, so an
+    # in-place change can't leave them stale
+    _gap_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _insights: Optional[tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_gap_score", None)
+            object.__setattr__(self, "_insights", None)
+    
     @property
     def gap_score(self) -> float:
         """
@@ -171,6 +207,11 @@ class KeywordAnalysis:
         
         Higher score = better opportunity.
         """
+        if self._gap_score is None:
+            object.__setattr__(self, "_gap_score", self._compute_gap_score())
+        return self._gap_score
+    
+    def _compute_gap_score(self) -> float:
         if not self.demand or not self.supply:
             return 0.0
         
@@ -200,90 +241,95 @@ class KeywordAnalysis:
     @property
     def gap_rating(self) -> GapScoreRating:
         """Get the gap score rating category."""
-        score = self.gap_score
-        if score >= 7:
-            return GapScoreRating.EXCELLENT
-        elif score >= 4:
-            return GapScoreRating.GOOD
-        return GapScoreRating.POOR
+        return GapScoreRating.for_score(self.gap_score)
     
     @property
     def gap_emoji(self) -> str:
         """Get emoji for gap rating."""
-        rating = self.gap_rating
-        if rating == GapScoreRating.EXCELLENT:
-            return "🟢"
-        elif rating == GapScoreRating.GOOD:
-            return "🟡"
-        return "🔴"
+        return self.gap_rating.emoji
     
     @property
-    def insights(self) -> list[str]:
+    def insights(self) -> tuple[str, ...]:
         """Generate insights about this keyword."""
-        insights = []
+        if self._insights is None:
+            object.__setattr__(self, "_insights", self._compute_insights())
+        return self._insights
+    
+    def _compute_insights(self) -> tuple[str, ...]:
+        supply = self.supply
+        demand = self.demand
+        trend = self.trend_data
+        
+        if not supply or not demand:
+            return ()
         
-        if not self.supply or not self.demand:
-            return insights
+        insights = []
         
         # Old video opportunity
-        if self.supply.has_old_video_dominance:
+        if supply.has_old_video_dominance:
             insights.append(
-                f"Top 10 dominated by old videos (avg {self.supply.avg_video_age_days:.0f} days) "
+                f"Top 10 dominated by old videos (avg {supply.avg_video_age_days:.0f} days) "
                 "- opportunity for fresh content!"
             )
         
         # Small channel wins
-        if self.supply.has_small_channel_wins:
+        if supply.has_small_channel_wins:
             insights.append(
-                f"{self.supply.small_channels_in_top_10} small channels (<10k subs) in Top 10 "
+                f"{supply.small_channels_in_top_10} small channels (<10k subs) in Top 10 "
                 "- you can compete!"
             )
         
         # Trend direction
-        if self.trend_data:
-            if self.trend_data.is_rising:
+        if trend:
+            if trend.is_rising:
                 insights.append(
-                    f"Trend: {self.trend_data.trend_emoji} Rising "
-                    f"(+{self.trend_data.trend_direction:.0f}% vs last year)"
+                    f"Trend: {trend.trend_emoji} Rising "
+                    f"(+{trend.trend_direction:.0f}% vs last year)"
                 )
-            elif self.trend_data.is_falling:
+            elif trend.is_falling:
                 insights.append(
-                    f"Trend: {self.trend_data.trend_emoji} Falling "
-                    f"({self.trend_data.trend_direction:.0f}% vs last year)"
+                    f"Trend: {trend.trend_emoji} Falling "
+                    f"({trend.trend_direction:.0f}% vs last year)"
                 )
         
         # High engagement
-        if self.demand.avg_engagement_rate > 5:
+        if demand.avg_engagement_rate > 5:
             insights.append(
-                f"High engagement rate ({self.demand.avg_engagement_rate:.1f}%) "
+                f"High engagement rate ({demand.avg_engagement_rate:.1f}%) "
                 "- audience is active!"
             )
         
         # Low competition
-        if self.supply.videos_last_30_days < 50:
+        if supply.videos_last_30_days < 50:
             insights.append(
-                f"Low upload volume ({self.supply.videos_last_30_days} videos/month) "
+                f"Low upload volume ({supply.videos_last_30_days} videos/month) "
                 "- not saturated!"
             )
         
-        return insights
+        return tuple(insights)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for export."""
+        # Read each derived value once
+        demand = self.demand
+        supply = self.supply
+        trend = self.trend_data
+        gap_score = self.gap_score
+        
         return {
             "keyword": self.keyword,
-            "gap_score": round(self.gap_score, 2),
-            "gap_rating": self.gap_rating.value,
-            "demand_score": round(self.demand.demand_score, 2) if self.demand else None,
-            "supply_score": round(self.supply.supply_score, 2) if self.supply else None,
-            "trend_index": self.trend_data.average_interest if self.trend_data else None,
-            "trend_direction": self.trend_data.trend_direction if self.trend_data else None,
-            "avg_views_top_10": int(self.demand.avg_views_top_10) if self.demand else None,
-            "videos_last_30_days": self.supply.videos_last_30_days if self.supply else None,
-            "avg_channel_size": int(self.supply.avg_channel_subscribers) if self.supply else None,
-            "small_channels_in_top_10": self.supply.small_channels_in_top_10 if self.supply else None,
-            "avg_video_age_days": int(self.supply.avg_video_age_days) if self.supply else None,
+            "gap_score": round(gap_score, 2),
+            "gap_rating": GapScoreRating.for_score(gap_score).value,
+            "demand_score": round(demand.demand_score, 2) if demand else None,
+            "supply_score": round(supply.supply_score, 2) if supply else None,
+            "trend_index": trend.average_interest if trend else None,
+            "trend_direction": trend.trend_direction if trend else None,
+            "avg_views_top_10": int(demand.avg_views_top_10) if demand else None,
+            "videos_last_30_days": supply.videos_last_30_days if supply else None,
+            "avg_channel_size": int(supply.avg_channel_subscribers) if supply else None,
+            "small_channels_in_top_10": supply.small_channels_in_top_10 if supply else None,
+            "avg_video_age_days": int(supply.avg_video_age_days) if supply else None,
             "suggestions_count": len(self.suggestions),
-            "insights": self.insights,
+            "insights": list(self.insights),
             "analyzed_at": self.analyzed_at.isoformat(),
         }
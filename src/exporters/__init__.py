@@ -1,6 +1,5 @@
 """Export modules for various formats."""
 
-from .notion import NotionExporter
 from .csv_export import export_to_csv, generate_csv_filename
 from .json_export import export_to_json, generate_json_filename
 
@@ -11,3 +10,11 @@ __all__ = [
     "export_to_json",
     "generate_json_filename",
 ]
+
+
+def __getattr__(name: str):
+    # Load the Notion exporter (notion_client, httpx) only when first used
+    if name == "NotionExporter":
+        from .notion import NotionExporter
+        return NotionExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,61 @@
 
 import csv
 from pathlib import Path
-from datetime import datetime
 from typing import Union
 
-from ..data.models import KeywordAnalysis
+from ..data.models import GapScoreRating, KeywordAnalysis
+from .naming import timestamped_filename
+
+
+# Column order; the insights column is appended when requested
+FIELDNAMES = (
+    "keyword",
+    "gap_score",
+    "gap_rating",
+    "demand_score",
+    "supply_score",
+    "trend_index",
+    "trend_direction",
+    "avg_views_top_10",
+    "videos_last_30_days",
+    "videos_last_7_days",
+    "avg_channel_subscribers",
+    "small_channels_in_top_10",
+    "avg_video_age_days",
+    "suggestions_count",
+    "analyzed_at",
+)
+
+
+def _build_row(analysis: KeywordAnalysis, include_insights: bool) -> tuple:
+    """Build one CSV row in FIELDNAMES order (blank cells for missing data)."""
+    demand = analysis.demand
+    supply = analysis.supply
+    trend = analysis.trend_data
+    gap_score = analysis.gap_score
+    
+    row = (
+        analysis.keyword,
+        round(gap_score, 2),
+        GapScoreRating.for_score(gap_score).value,
+        round(demand.demand_score, 2) if demand else "",
+        round(supply.supply_score, 2) if supply else "",
+        round(demand.trend_index, 0) if demand else "",
+        f"{trend.trend_direction:+.0f}%" if trend else "",
+        int(demand.avg_views_top_10) if demand else "",
+        supply.videos_last_30_days if supply else "",
+        supply.videos_last_7_days if supply else "",
+        int(supply.avg_channel_subscribers) if supply else "",
+        supply.small_channels_in_top_10 if supply else "",
+        int(supply.avg_video_age_days) if supply else "",
+        len(analysis.suggestions),
+        analysis.analyzed_at.isoformat(),
+    )
+    
+    if include_insights:
+        row += (" | ".join(analysis.insights),)
+    
+    return row
 
 
 def export_to_csv(
@@ -27,66 +78,17 @@ def export_to_csv(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Define columns
-    fieldnames = [
-        "keyword",
-        "gap_score",
-        "gap_rating",
-        "demand_score",
-        "supply_score",
-        "trend_index",
-        "trend_direction",
-        "avg_views_top_10",
-        "videos_last_30_days",
-        "videos_last_7_days",
-        "avg_channel_subscribers",
-        "small_channels_in_top_10",
-        "avg_video_age_days",
-        "suggestions_count",
-        "analyzed_at",
-    ]
+    header = FIELDNAMES + ("insights",) if include_insights else FIELDNAMES
+    rows = [_build_row(analysis, include_insights) for analysis in analyses]
     
-    if include_insights:
-        fieldnames.append("insights")
-    
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for analysis in analyses:
-            row = {
-                "keyword": analysis.keyword,
-                "gap_score": round(analysis.gap_score, 2),
-                "gap_rating": analysis.gap_rating.value,
-                "suggestions_count": len(analysis.suggestions),
-                "analyzed_at": analysis.analyzed_at.isoformat(),
-            }
-            
-            if analysis.demand:
-                row["demand_score"] = round(analysis.demand.demand_score, 2)
-                row["trend_index"] = round(analysis.demand.trend_index, 0)
-                row["avg_views_top_10"] = int(analysis.demand.avg_views_top_10)
-            
-            if analysis.supply:
-                row["supply_score"] = round(analysis.supply.supply_score, 2)
-                row["videos_last_30_days"] = analysis.supply.videos_last_30_days
-                row["videos_last_7_days"] = analysis.supply.videos_last_7_days
-                row["avg_channel_subscribers"] = int(analysis.supply.avg_channel_subscribers)
-                row["small_channels_in_top_10"] = analysis.supply.small_channels_in_top_10
-                row["avg_video_age_days"] = int(analysis.supply.avg_video_age_days)
-            
-            if analysis.trend_data:
-                row["trend_direction"] = f"{analysis.trend_data.trend_direction:+.0f}%"
-            
-            if include_insights:
-                row["insights"] = " | ".join(analysis.insights)
-            
-            writer.writerow(row)
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
     
     return output_path
 
 
 def generate_csv_filename(prefix: str = "keywords_analysis") -> str:
     """Generate a timestamped filename for CSV export."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{prefix}_{timestamp}.csv"
+    return timestamped_filename(prefix, "csv")
@@ -5,7 +5,23 @@ from pathlib import Path
 from datetime import datetime
 from typing import Union
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..data.models import KeywordAnalysis
+from .naming import timestamped_filename
+
+
+def _encode(value, pretty: bool) -> bytes:
+    """Encode one JSON value as UTF-8 bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
 
 
 def export_to_json(
@@ -16,6 +32,9 @@ def export_to_json(
     """
     Export keyword analyses to JSON file.
     
+    Records are encoded and written one at a time, so memory use does not
+    grow with the number of keywords.
+    
     Args:
         analyses: List of KeywordAnalysis objects
         output_path: Output file path
@@ -27,22 +46,31 @@ def export_to_json(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    data = {
-        "generated_at": datetime.now().isoformat(),
-        "total_keywords": len(analyses),
-        "keywords": [analysis.to_dict() for analysis in analyses]
-    }
+    # Lay out {"generated_at", "total_keywords", "keywords": [...]} by hand,
+    # matching what a single dump of the whole document would produce
+    newline, indent, colon = (b"\n", b"  ", b": ") if pretty else (b"", b"", b":")
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(
+            b"{" + newline
+            + indent + b'"generated_at"' + colon + _encode(datetime.now().isoformat(), pretty)
+            + b"," + newline
+            + indent + b'"total_keywords"' + colon + _encode(len(analyses), pretty)
+            + b"," + newline
+            + indent + b'"keywords"' + colon + b"["
+        )
+        
+        for i, analysis in enumerate(analyses):
+            record = _encode(analysis.to_dict(), pretty)
+            if pretty:
+                record = record.replace(b"\n", b"\n    ")
+            f.write((b"," if i else b"") + newline + indent * 2 + record)
+        
+        f.write((newline + indent if analyses else b"") + b"]" + newline + b"}")
     
     return output_path
 
 
 def generate_json_filename(prefix: str = "keywords_analysis") -> str:
     """Generate a timestamped filename for JSON export."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{prefix}_{timestamp}.json"
+    return timestamped_filename(prefix, "json")
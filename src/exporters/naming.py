@@ -0,0 +1,17 @@
+"""Output filename helpers shared by the exporters."""
+
+from datetime import datetime
+
+
+def timestamped_filename(prefix: str, extension: str) -> str:
+    """
+    Build '<prefix>_YYYYMMDD_HHMMSS.<extension>' for the current time.
+    
+    Formats the fields directly rather than through strftime, which parses
+    the format string on every call.
+    """
+    n = datetime.now()
+    return (
+        f"{prefix}_{n.year:04d}{n.month:02d}{n.day:02d}"
+        f"_{n.hour:02d}{n.minute:02d}{n.second:02d}.{extension}"
+    )
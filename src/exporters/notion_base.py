@@ -2,11 +2,14 @@
 
 from datetime import datetime
 from typing import Optional
+
+import httpx
 from notion_client import Client
 from notion_client.errors import APIResponseError
 
 from ..data.models import KeywordAnalysis, GapScoreRating
 from ..utils.config import config
+from ..utils.rate_limiter import rate_limiters
 
 
 class NotionExporter:
@@ -17,6 +20,13 @@ class NotionExporter:
     as a mini-presentation with charts and insights.
     """
     
+    # Select option names for each rating (must match the "Rating" options)
+    RATING_TEXT = {
+        GapScoreRating.EXCELLENT: "🟢 Excellent",
+        GapScoreRating.GOOD: "🟡 Good",
+        GapScoreRating.POOR: "🔴 Poor",
+    }
+    
     # Database properties schema
     DATABASE_PROPERTIES = {
         "Keyword": {"title": {}},
@@ -48,7 +58,15 @@ class NotionExporter:
         if not self.api_key:
             raise ValueError("Notion API key is required. Set NOTION_API_KEY in .env")
         
-        self.client = Client(auth=self.api_key)
+        # Hand the SDK a pooled HTTP/2 transport so concurrent page
+        # creations share one connection to api.notion.com
+        self.client = Client(
+            auth=self.api_key,
+            client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            ),
+        )
         self.database_id = config.notion_database_id
     
     def create_database(
@@ -67,6 +85,7 @@ class NotionExporter:
             The created database ID
         """
         try:
+            rate_limiters.wait("notion")
             response = self.client.databases.create(
                 parent={"type": "page_id", "page_id": parent_page_id},
                 title=[{"type": "text", "text": {"content": title}}],
@@ -84,8 +103,4 @@ class NotionExporter:
     
     def _get_rating_text(self, rating: GapScoreRating) -> str:
         """Convert rating enum to display text."""
-        if rating == GapScoreRating.EXCELLENT:
-            return "🟢 Excellent"
-        elif rating == GapScoreRating.GOOD:
-            return "🟡 Good"
-        return "🔴 Poor"
+        return self.RATING_TEXT[rating]
@@ -1,146 +1,105 @@
 """Notion page content builder for keyword analysis."""
 
-from ..data.models import KeywordAnalysis
+from ..data.models import GapScoreRating, KeywordAnalysis
 
+_CALLOUT_COLORS = {
+    GapScoreRating.EXCELLENT: "green_background",
+    GapScoreRating.GOOD: "yellow_background",
+    GapScoreRating.POOR: "red_background",
+}
 
-def build_page_content(analysis: KeywordAnalysis) -> list[dict]:
-    """Build rich page content with insights and metrics."""
-    blocks = []
-    
-    # Header
-    blocks.append({
-        "object": "block",
-        "type": "heading_1",
-        "heading_1": {
-            "rich_text": [{"type": "text", "text": {"content": f"🎯 {analysis.keyword}"}}]
-        }
-    })
-    
-    # Gap Score callout
-    color = "green_background" if analysis.gap_score >= 7 else \
-            "yellow_background" if analysis.gap_score >= 4 else "red_background"
-    
-    blocks.append({
+
+def _rich_text(text: str) -> list[dict]:
+    return [{"type": "text", "text": {"content": text}}]
+
+
+def _block(block_type: str, text: str) -> dict:
+    return {"object": "block", "type": block_type, block_type: {"rich_text": _rich_text(text)}}
+
+
+def _h1(text: str) -> dict:
+    return _block("heading_1", text)
+
+
+def _h2(text: str) -> dict:
+    return _block("heading_2", text)
+
+
+def _para(text: str) -> dict:
+    return _block("paragraph", text)
+
+
+def _bullet(text: str) -> dict:
+    return _block("bulleted_list_item", text)
+
+
+def _callout(text: str, emoji: str, color: str) -> dict:
+    return {
         "object": "block",
         "type": "callout",
         "callout": {
-            "rich_text": [{
-                "type": "text",
-                "text": {"content": f"Gap Score: {analysis.gap_score:.1f}/10 {analysis.gap_emoji}"}
-            }],
-            "icon": {"type": "emoji", "emoji": "📊"},
+            "rich_text": _rich_text(text),
+            "icon": {"type": "emoji", "emoji": emoji},
             "color": color
         }
-    })
+    }
+
+
+def _divider() -> dict:
+    return {"object": "block", "type": "divider", "divider": {}}
+
+
+def build_page_content(analysis: KeywordAnalysis) -> list[dict]:
+    """Build rich page content with insights and metrics."""
+    # Read each derived value once
+    score = analysis.gap_score
+    demand = analysis.demand
+    supply = analysis.supply
+    trend = analysis.trend_data
+    insights = analysis.insights
     
-    blocks.append({"object": "block", "type": "divider", "divider": {}})
+    color = _CALLOUT_COLORS[GapScoreRating.for_score(score)]
     
-    # Demand Metrics
-    blocks.append({
-        "object": "block",
-        "type": "heading_2",
-        "heading_2": {
-            "rich_text": [{"type": "text", "text": {"content": "📈 Demand Metrics"}}]
-        }
-    })
+    # Header and Gap Score callout
+    blocks = [
+        _h1(f"🎯 {analysis.keyword}"),
+        _callout(f"Gap Score: {score:.1f}/10 {analysis.gap_emoji}", "📊", color),
+        _divider(),
+        _h2("📈 Demand Metrics"),
+    ]
     
-    if analysis.demand:
-        demand_text = f"""• Trend Index: {analysis.demand.trend_index:.0f}/100
-• Avg Views (Top 10): {analysis.demand.avg_views_top_10:,.0f}
-• Engagement Rate: {analysis.demand.avg_engagement_rate:.1f}%
-• Demand Score: {analysis.demand.demand_score:.1f}/10"""
-        
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": demand_text}}]
-            }
-        })
+    if demand:
+        blocks.append(_para(f"""• Trend Index: {demand.trend_index:.0f}/100
+• Avg Views (Top 10): {demand.avg_views_top_10:,.0f}
+• Engagement Rate: {demand.avg_engagement_rate:.1f}%
+• Demand Score: {demand.demand_score:.1f}/10"""))
     
     # Supply Metrics
-    blocks.append({
-        "object": "block",
-        "type": "heading_2",
-        "heading_2": {
-            "rich_text": [{"type": "text", "text": {"content": "📦 Supply Metrics"}}]
-        }
-    })
+    blocks.append(_h2("📦 Supply Metrics"))
     
-    if analysis.supply:
-        supply_text = f"""• Videos (last 30 days): {analysis.supply.videos_last_30_days}
-• Videos (last 7 days): {analysis.supply.videos_last_7_days}
-• Avg Channel Size: {analysis.supply.avg_channel_subscribers:,.0f} subs
-• Small Channels %: {analysis.supply.small_channels_in_top_10}
-• Avg Video Age: {analysis.supply.avg_video_age_days:.0f} days
-• Supply Score: {analysis.supply.supply_score:.1f}/10"""
-        
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": supply_text}}]
-            }
-        })
+    if supply:
+        blocks.append(_para(f"""• Videos (last 30 days): {supply.videos_last_30_days}
+• Videos (last 7 days): {supply.videos_last_7_days}
+• Avg Channel Size: {supply.avg_channel_subscribers:,.0f} subs
+• Small Channels %: {supply.small_channels_in_top_10}
+• Avg Video Age: {supply.avg_video_age_days:.0f} days
+• Supply Score: {supply.supply_score:.1f}/10"""))
     
     # Insights
-    if analysis.insights:
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "💡 Insights"}}]
-            }
-        })
-        
-        for insight in analysis.insights:
-            blocks.append({
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{"type": "text", "text": {"content": insight}}]
-                }
-            })
+    if insights:
+        blocks.append(_h2("💡 Insights"))
+        blocks.extend(_bullet(insight) for insight in insights)
     
     # Trend Info
-    if analysis.trend_data and analysis.trend_data.peak_month:
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "📊 Trend Info"}}]
-            }
-        })
-        
-        trend_text = f"""• Direction: {analysis.trend_data.trend_emoji} {analysis.trend_data.trend_direction:+.0f}%
-• Peak Month: {analysis.trend_data.peak_month}
-• Average Interest: {analysis.trend_data.average_interest:.0f}/100"""
-        
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": [{"type": "text", "text": {"content": trend_text}}]
-            }
-        })
+    if trend and trend.peak_month:
+        blocks.append(_h2("📊 Trend Info"))
+        blocks.append(_para(f"""• Direction: {trend.trend_emoji} {trend.trend_direction:+.0f}%
+• Peak Month: {trend.peak_month}
+• Average Interest: {trend.average_interest:.0f}/100"""))
     
     # Related Keywords
     if analysis.suggestions:
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "🔗 Related Keywords"}}]
-            }
-        })
-        
-        for suggestion in analysis.suggestions[:10]:
-            blocks.append({
-                "object": "block",
-                "type": "bulleted_list_item",
-                "bulleted_list_item": {
-                    "rich_text": [{"type": "text", "text": {"content": suggestion.keyword}}]
-                }
-            })
+        blocks.append(_h2("🔗 Related Keywords"))
+        blocks.extend(_bullet(suggestion.keyword) for suggestion in analysis.suggestions[:10])
     
     return blocks
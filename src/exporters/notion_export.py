@@ -1,38 +1,68 @@
 """Notion export functions for keyword analysis."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
-from notion_client.errors import APIResponseError
+from notion_client.errors import APIErrorCode, APIResponseError
 
-from ..data.models import KeywordAnalysis
+from ..data.models import GapScoreRating, KeywordAnalysis
+from ..utils.rate_limiter import rate_limiters
 from .notion_base import NotionExporter
 from .notion_content import build_page_content
 
+# Notion allows about 3 requests/second per integration; keeping that many
+# in flight overlaps round trips without constantly hitting the limit
+MAX_CONCURRENT_EXPORTS = 3
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+def _title_property(text: str) -> dict:
+    return {"title": [{"text": {"content": text}}]}
+
+
+def _number_property(value) -> dict:
+    return {"number": value}
+
+
+def _rich_text_property(text: str) -> dict:
+    return {"rich_text": [{"text": {"content": text}}]}
+
 
 def _build_properties(exporter: NotionExporter, analysis: KeywordAnalysis) -> dict:
     """Build Notion page properties from analysis."""
+    score = analysis.gap_score
+    demand = analysis.demand
+    supply = analysis.supply
+    trend = analysis.trend_data
+    
     properties = {
-        "Keyword": {"title": [{"text": {"content": analysis.keyword}}]},
-        "Gap Score": {"number": round(analysis.gap_score, 2)},
-        "Rating": {"select": {"name": exporter._get_rating_text(analysis.gap_rating)}},
+        "Keyword": _title_property(analysis.keyword),
+        "Gap Score": _number_property(round(score, 2)),
+        "Rating": {"select": {"name": exporter._get_rating_text(GapScoreRating.for_score(score))}},
         "Analyzed At": {"date": {"start": analysis.analyzed_at.isoformat()}},
-        "Suggestions Count": {"number": len(analysis.suggestions)},
+        "Suggestions Count": _number_property(len(analysis.suggestions)),
     }
     
-    if analysis.demand:
-        properties["Demand Score"] = {"number": round(analysis.demand.demand_score, 2)}
-        properties["Trend Index"] = {"number": round(analysis.demand.trend_index, 0)}
-        properties["Avg Views (Top 10)"] = {"number": int(analysis.demand.avg_views_top_10)}
+    if demand:
+        properties.update({
+            "Demand Score": _number_property(round(demand.demand_score, 2)),
+            "Trend Index": _number_property(round(demand.trend_index, 0)),
+            "Avg Views (Top 10)": _number_property(int(demand.avg_views_top_10)),
+        })
     
-    if analysis.supply:
-        properties["Supply Score"] = {"number": round(analysis.supply.supply_score, 2)}
-        properties["Videos (30 days)"] = {"number": analysis.supply.videos_last_30_days}
-        properties["Avg Channel Size"] = {"number": int(analysis.supply.avg_channel_subscribers)}
-        properties["Small Channels %"] = {"number": analysis.supply.small_channels_in_top_10}
-        properties["Avg Video Age (days)"] = {"number": int(analysis.supply.avg_video_age_days)}
+    if supply:
+        properties.update({
+            "Supply Score": _number_property(round(supply.supply_score, 2)),
+            "Videos (30 days)": _number_property(supply.videos_last_30_days),
+            "Avg Channel Size": _number_property(int(supply.avg_channel_subscribers)),
+            "Small Channels %": _number_property(supply.small_channels_in_top_10),
+            "Avg Video Age (days)": _number_property(int(supply.avg_video_age_days)),
+        })
     
-    if analysis.trend_data:
-        trend_text = f"{analysis.trend_data.trend_emoji} {analysis.trend_data.trend_direction:+.0f}%"
-        properties["Trend Direction"] = {"rich_text": [{"text": {"content": trend_text}}]}
+    if trend:
+        properties["Trend Direction"] = _rich_text_property(
+            f"{trend.trend_emoji} {trend.trend_direction:+.0f}%"
+        )
     
     return properties
 
@@ -58,27 +88,47 @@ def export_analysis(
     
     properties = _build_properties(exporter, analysis)
     
-    # Set icon based on rating
-    icon_emoji = "🟢" if analysis.gap_score >= 7 else "🟡" if analysis.gap_score >= 4 else "🔴"
-    
     try:
         page_data = {
             "parent": {"database_id": exporter.database_id},
             "properties": properties,
-            "icon": {"type": "emoji", "emoji": icon_emoji},
+            "icon": {"type": "emoji", "emoji": analysis.gap_emoji},
         }
         
         if include_content:
             page_data["children"] = build_page_content(analysis)
         
+        rate_limiters.wait("notion")
         response = exporter.client.pages.create(**page_data)
         return response["id"]
         
     except APIResponseError as e:
-        print(f"Error creating page: {e}")
+        # Rate-limit responses are retried by _export_with_retry
+        if e.code != APIErrorCode.RateLimited:
+            print(f"Error creating page: {e}")
         raise
 
 
+def _export_with_retry(
+    exporter: NotionExporter,
+    analysis: KeywordAnalysis,
+    include_content: bool
+) -> str:
+    """
+    Export one analysis, waiting out Notion rate-limit responses.
+    
+    Requests are already paced by the "notion" rate limiter; this only
+    handles the occasional 429 that still gets through.
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            return export_analysis(exporter, analysis, include_content)
+        except APIResponseError as e:
+            if e.code != APIErrorCode.RateLimited or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            time.sleep(float(e.headers.get("Retry-After", 1)))
+
+
 def export_multiple(
     exporter: NotionExporter,
     analyses: list[KeywordAnalysis],
@@ -88,6 +138,9 @@ def export_multiple(
     """
     Export multiple keyword analyses to Notion.
     
+    Pages are created concurrently (up to MAX_CONCURRENT_EXPORTS at a
+    time); the progress callback fires as each one finishes.
+    
     Args:
         exporter: NotionExporter instance
         analyses: List of KeywordAnalysis objects
@@ -95,22 +148,28 @@ def export_multiple(
         progress_callback: Optional callback(current, total, keyword)
         
     Returns:
-        List of created page IDs
+        List of created page IDs, in the order of the analyses
     """
-    page_ids = []
     total = len(analyses)
+    page_ids: list[Optional[str]] = [None] * total
     
-    for i, analysis in enumerate(analyses):
-        if progress_callback:
-            progress_callback(i + 1, total, analysis.keyword)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_EXPORTS) as executor:
+        futures = {
+            executor.submit(_export_with_retry, exporter, analysis, include_content): i
+            for i, analysis in enumerate(analyses)
+        }
         
-        try:
-            page_id = export_analysis(exporter, analysis, include_content)
-            page_ids.append(page_id)
-        except Exception as e:
-            print(f"Error exporting '{analysis.keyword}': {e}")
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            if progress_callback:
+                progress_callback(done, total, analyses[i].keyword)
+            
+            try:
+                page_ids[i] = future.result()
+            except Exception as e:
+                print(f"Error exporting '{analyses[i].keyword}': {e}")
     
-    return page_ids
+    return [page_id for page_id in page_ids if page_id is not None]
 
 
 # Add methods to NotionExporter class
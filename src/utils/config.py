@@ -1,16 +1,17 @@
 """Configuration management for YouTube SEO Tool."""
 
+from __future__ import annotations
+
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 from dataclasses import dataclass
-from typing import Optional
 
 # Load .env file
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
     
@@ -22,7 +23,7 @@ class Config:
     notion_database_id: str = ""
     
     # Google Trends
-    trends_proxy: Optional[str] = None
+    trends_proxy: str | None = None
     
     # Cache
     cache_ttl_hours: int = 24
@@ -30,6 +31,7 @@ class Config:
     
     # Rate Limiting
     youtube_requests_per_day: int = 100  # Conservative to stay under 10k quota
+    youtube_quota_per_day: int = 10000  # Quota units (search = 100, list = 1)
     trends_requests_per_minute: int = 10
     
     # Analysis Settings
@@ -37,7 +39,7 @@ class Config:
     recent_days_supply: int = 30
     
     @classmethod
-    def from_env(cls) -> "Config":
+    def from_env(cls) -> Config:
         """Load configuration from environment variables."""
         return cls(
             youtube_api_key=os.getenv("YOUTUBE_API_KEY", ""),
@@ -45,6 +47,7 @@ class Config:
             notion_database_id=os.getenv("NOTION_DATABASE_ID", ""),
             trends_proxy=os.getenv("TRENDS_PROXY"),
             cache_ttl_hours=int(os.getenv("CACHE_TTL_HOURS", "24")),
+            youtube_quota_per_day=int(os.getenv("YOUTUBE_QUOTA_PER_DAY", "10000")),
         )
     
     def validate(self) -> list[str]:
@@ -1,35 +1,52 @@
 """Rate limiting utilities using Token Bucket algorithm."""
 
+from __future__ import annotations
+
 import time
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Optional
 
+from .config import config
+
+
+# Tokens are tracked in millionths so refill works in integer arithmetic
+MICRO = 1_000_000
+# Fixed-point shift for the per-nanosecond refill rate
+RATE_SHIFT = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimiter:
     """
     Token Bucket rate limiter.
     
     Allows bursts up to max_tokens, then limits to tokens_per_second.
+    Internally the balance is an integer count of micro-tokens refilled
+    from time.monotonic_ns(), so the hot path never boxes floats.
     """
     
     tokens_per_second: float
     max_tokens: int
-    tokens: float = field(init=False)
-    last_update: float = field(init=False)
     lock: Lock = field(default_factory=Lock, init=False)
+    _micro_tokens: int = field(init=False, repr=False)
+    _capacity: int = field(init=False, repr=False)
+    _rate_fp: int = field(init=False, repr=False)  # micro-tokens/ns << RATE_SHIFT
+    _last_ns: int = field(init=False, repr=False)
     
     def __post_init__(self):
-        self.tokens = float(self.max_tokens)
-        self.last_update = time.time()
+        if self.tokens_per_second <= 0:
+            raise ValueError(f"tokens_per_second must be positive, got {self.tokens_per_second}")
+        
+        self._capacity = self.max_tokens * MICRO
+        self._micro_tokens = self._capacity
+        # Very slow rates (a few tokens a day) would round to zero
+        self._rate_fp = max(1, round(self.tokens_per_second * MICRO / 1e9 * (1 << RATE_SHIFT)))
+        self._last_ns = time.monotonic_ns()
     
-    def _add_tokens(self):
-        """Add tokens based on time elapsed."""
-        now = time.time()
-        elapsed = now - self.last_update
-        self.tokens = min(self.max_tokens, self.tokens + elapsed * self.tokens_per_second)
-        self.last_update = now
+    @property
+    def tokens(self) -> float:
+        """Current balance as of the last acquire (negative while in debt)."""
+        return self._micro_tokens / MICRO
     
     def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
         """
@@ -42,36 +59,45 @@ class RateLimiter:
         Returns:
             True if tokens were acquired, False otherwise
         """
+        needed = tokens * MICRO
+        rate_fp = self._rate_fp
+        
         with self.lock:
-            self._add_tokens()
+            # Refill for the time elapsed since the last call
+            now = time.monotonic_ns()
+            available = min(
+                self._capacity,
+                self._micro_tokens + (((now - self._last_ns) * rate_fp) >> RATE_SHIFT),
+            )
+            self._last_ns = now
             
-            if self.tokens >= tokens:
-                self.tokens -= tokens
+            if available >= needed:
+                self._micro_tokens = available - needed
                 return True
             
             if not blocking:
+                self._micro_tokens = available
                 return False
             
-            # Calculate wait time
-            needed = tokens - self.tokens
-            wait_time = needed / self.tokens_per_second
-            
-        # Wait outside the lock
-        time.sleep(wait_time)
+            # Reserve the tokens now, leaving the bucket in debt; refill
+            # pays the debt back by the time the wait is over, and later
+            # callers queue behind it
+            self._micro_tokens = available - needed
         
-        with self.lock:
-            self._add_tokens()
-            self.tokens -= tokens
-            return True
+        # Wait outside the lock
+        time.sleep(((needed - available) << RATE_SHIFT) / rate_fp / 1e9)
+        return True
     
-    def wait(self):
-        """Wait for one token to become available."""
-        self.acquire(1, blocking=True)
+    def wait(self, tokens: int = 1):
+        """Wait for tokens to become available."""
+        self.acquire(tokens, blocking=True)
 
 
 class MultiRateLimiter:
     """Manage multiple rate limiters for different APIs."""
     
+    __slots__ = ("limiters",)
+    
     def __init__(self):
         self.limiters: dict[str, RateLimiter] = {}
     
@@ -84,20 +110,28 @@ class MultiRateLimiter:
     
     def acquire(self, name: str, tokens: int = 1, blocking: bool = True) -> bool:
         """Acquire tokens from a named limiter."""
-        if name not in self.limiters:
+        limiter = self.limiters.get(name)
+        if limiter is None:
             return True  # No limiter = no limit
-        return self.limiters[name].acquire(tokens, blocking)
+        return limiter.acquire(tokens, blocking)
     
-    def wait(self, name: str):
-        """Wait for one token from a named limiter."""
-        if name in self.limiters:
-            self.limiters[name].wait()
+    def wait(self, name: str, tokens: int = 1):
+        """Wait for tokens from a named limiter."""
+        limiter = self.limiters.get(name)
+        if limiter is not None:
+            limiter.acquire(tokens, blocking=True)
 
 
 # Global rate limiter instance
 rate_limiters = MultiRateLimiter()
 
 # Configure default limiters
-rate_limiters.add_limiter("youtube", tokens_per_second=1, max_tokens=5)  # 1/sec, burst of 5
+# YouTube is metered in quota units: the whole daily quota is available as
+# burst, refilled at the sustained daily rate
+rate_limiters.add_limiter(
+    "youtube",
+    tokens_per_second=config.youtube_quota_per_day / 86400,
+    max_tokens=config.youtube_quota_per_day,
+)
 rate_limiters.add_limiter("trends", tokens_per_second=0.5, max_tokens=3)  # 1 per 2 sec
 rate_limiters.add_limiter("notion", tokens_per_second=3, max_tokens=3)  # 3/sec as per API
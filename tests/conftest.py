@@ -0,0 +1,59 @@
+"""Shared fixtures."""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.data.models import (
+    DemandMetrics,
+    KeywordAnalysis,
+    KeywordSuggestion,
+    SupplyMetrics,
+    TrendData,
+)
+
+
+def random_analyses(count: int, seed: int = 0) -> list[KeywordAnalysis]:
+    """Analyses covering missing metrics, zero supply and every bonus."""
+    rng = random.Random(seed)
+    analyses = []
+
+    for i in range(count):
+        demand = DemandMetrics(
+            trend_index=rng.choice([0, rng.uniform(0, 100)]),
+            avg_views_top_10=rng.choice([0, rng.uniform(0, 1e7)]),
+            total_views_top_10=rng.randint(0, 10**8),
+            avg_engagement_rate=rng.uniform(0, 10),
+        ) if rng.random() > 0.1 else None
+
+        supply = SupplyMetrics(
+            videos_last_30_days=rng.choice([0, rng.randint(0, 200)]),
+            videos_last_7_days=rng.randint(0, 50),
+            avg_channel_subscribers=rng.choice([0, rng.uniform(0, 1e7)]),
+            small_channels_in_top_10=rng.randint(0, 10),
+            avg_video_age_days=rng.uniform(0, 900),
+        ) if rng.random() > 0.1 else None
+
+        trend = TrendData(
+            keyword=f"kw {i}",
+            average_interest=rng.uniform(0, 100),
+            trend_direction=rng.uniform(-40, 40),
+            peak_month=rng.choice([None, "March"]),
+        ) if rng.random() > 0.3 else None
+
+        analyses.append(KeywordAnalysis(
+            keyword=f"kw {i}, \"quoted\" é",
+            suggestions=[KeywordSuggestion(keyword=f"kw {i} s", position=1)],
+            trend_data=trend,
+            demand=demand,
+            supply=supply,
+            analyzed_at=datetime(2025, 1, 1, 12, 0, i % 60),
+        ))
+
+    return analyses
+
+
+@pytest.fixture
+def analyses() -> list[KeywordAnalysis]:
+    return random_analyses(50)
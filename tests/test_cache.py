@@ -0,0 +1,84 @@
+"""Tests for the SQLite cache and its value codec."""
+
+import importlib
+import sqlite3
+
+import pytest
+
+from src.data.cache import COMPRESS_MIN_BYTES, SCHEMA_VERSION, Cache, _decode, _dumps, _encode
+
+# src.data re-exports the global `cache` instance under the module's name
+cache_module = importlib.import_module("src.data.cache")
+
+SMALL = {"title": "video", "views": 12, "tags": ["a", "b"], "missing": None}
+LARGE = [{"video_id": f"id{i}", "title": "some title " * 5} for i in range(100)]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "cache.db"
+
+
+@pytest.mark.parametrize("value", [SMALL, LARGE, "text", 3.5, [], None])
+def test_codec_round_trip(value):
+    assert _decode(_encode(value)) == value
+
+
+def test_small_values_stored_raw():
+    assert _encode(SMALL)[:1] == cache_module._RAW
+
+
+def test_large_values_compressed_when_zstd_available():
+    pytest.importorskip("zstandard")
+    blob = _encode(LARGE)
+
+    assert blob[:1] == cache_module._ZSTD
+    assert len(blob) < len(_dumps(LARGE))
+
+
+def test_large_values_stored_raw_without_zstd(monkeypatch):
+    monkeypatch.setattr(cache_module, "ZSTD_AVAILABLE", False)
+    blob = _encode(LARGE)
+
+    assert blob[:1] == cache_module._RAW
+    assert len(blob) > COMPRESS_MIN_BYTES
+
+
+def test_values_survive_reopen(db_path):
+    Cache(db_path).set("search", ("kw", "relevance", 10, None, None), LARGE)
+    Cache(db_path).set("video", "abc", SMALL)
+
+    # A fresh instance has an empty memory layer, so this reads SQLite
+    reopened = Cache(db_path)
+    assert reopened.get("search", ("kw", "relevance", 10, None, None)) == LARGE
+    assert reopened.get("video", "abc") == SMALL
+    assert reopened.get("video", "other") is None
+
+
+def test_zstd_rows_read_as_miss_without_zstd(db_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    Cache(db_path).set("search", "kw", LARGE)
+
+    monkeypatch.setattr(cache_module, "ZSTD_AVAILABLE", False)
+    assert Cache(db_path).get("search", "kw") is None
+
+
+def test_old_schema_is_dropped(db_path):
+    Cache(db_path).set("video", "abc", SMALL)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+    conn.close()
+
+    reopened = Cache(db_path)
+    assert reopened.get("video", "abc") is None
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    conn.close()
+
+
+def test_current_schema_is_kept(db_path):
+    Cache(db_path).set("video", "abc", SMALL)
+
+    assert Cache(db_path).get("video", "abc") == SMALL
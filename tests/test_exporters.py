@@ -0,0 +1,75 @@
+"""Tests for the CSV and JSON exporters."""
+
+import csv
+import json
+from datetime import datetime
+
+import pytest
+
+from src.exporters import csv_export, json_export
+from src.exporters.csv_export import export_to_csv
+from src.exporters.json_export import export_to_json
+
+
+def test_csv_header_and_rows(analyses, tmp_path):
+    path = export_to_csv(analyses[:3], tmp_path / "out.csv", include_insights=False)
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert lines[0] == ",".join(csv_export.FIELDNAMES)
+    assert len(lines) == 4
+
+
+def test_csv_cells_read_back(analyses, tmp_path):
+    path = export_to_csv(analyses, tmp_path / "out.csv")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == len(analyses)
+    for analysis, row in zip(analyses, rows):
+        assert row["keyword"] == analysis.keyword
+        assert float(row["gap_score"]) == round(analysis.gap_score, 2)
+        assert row["insights"] == " | ".join(analysis.insights)
+        if analysis.demand is None:
+            assert row["demand_score"] == row["avg_views_top_10"] == ""
+        if analysis.supply is None:
+            assert row["supply_score"] == row["videos_last_30_days"] == ""
+
+
+@pytest.fixture
+def fixed_now(monkeypatch):
+    now = datetime(2025, 1, 1, 8, 30)
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(json_export, "datetime", FixedDatetime)
+    return now
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+@pytest.mark.parametrize("pretty", [True, False])
+@pytest.mark.parametrize("count", [0, 1, 25])
+def test_json_matches_single_document_dump(
+    analyses, tmp_path, monkeypatch, fixed_now, orjson_available, pretty, count
+):
+    if orjson_available:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(json_export, "ORJSON_AVAILABLE", orjson_available)
+    batch = analyses[:count]
+
+    path = export_to_json(batch, tmp_path / "out.json", pretty=pretty)
+
+    document = {
+        "generated_at": fixed_now.isoformat(),
+        "total_keywords": count,
+        "keywords": [a.to_dict() for a in batch],
+    }
+    if pretty:
+        expected = json.dumps(document, indent=2, ensure_ascii=False)
+    else:
+        expected = json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+
+    assert path.read_bytes() == expected.encode()
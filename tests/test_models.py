@@ -0,0 +1,47 @@
+"""Tests for the data models."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.data.models import DemandMetrics, KeywordAnalysis, SupplyMetrics, TrendData
+
+
+def make_analysis(trend_direction: float = 0.0) -> KeywordAnalysis:
+    return KeywordAnalysis(
+        keyword="test",
+        trend_data=TrendData(keyword="test", trend_direction=trend_direction),
+        demand=DemandMetrics(
+            trend_index=50,
+            avg_views_top_10=20_000,
+            total_views_top_10=200_000,
+            avg_engagement_rate=3.0,
+        ),
+        supply=SupplyMetrics(
+            videos_last_30_days=40,
+            videos_last_7_days=10,
+            avg_channel_subscribers=50_000,
+            small_channels_in_top_10=1,
+            avg_video_age_days=100,
+        ),
+    )
+
+
+def test_inputs_cannot_change_in_place():
+    analysis = make_analysis()
+    with pytest.raises(FrozenInstanceError):
+        analysis.trend_data.trend_direction = 50
+    with pytest.raises(FrozenInstanceError):
+        analysis.supply.videos_last_30_days = 0
+
+
+def test_reassigning_input_resets_memoized_values():
+    analysis = make_analysis(trend_direction=0)
+    flat_score = analysis.gap_score
+    flat_insights = analysis.insights
+
+    analysis.trend_data = TrendData(keyword="test", trend_direction=50)
+
+    assert analysis.gap_score == make_analysis(trend_direction=50).gap_score
+    assert analysis.gap_score != flat_score
+    assert analysis.insights != flat_insights
@@ -0,0 +1,120 @@
+"""Tests for the token-bucket rate limiter."""
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record time.sleep calls made by the limiter instead of sleeping."""
+    calls = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", calls.append)
+    return calls
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_non_positive_rate_rejected(rate):
+    with pytest.raises(ValueError):
+        RateLimiter(tokens_per_second=rate, max_tokens=1)
+
+
+def test_slow_rate_blocks_for_refill_time(sleeps):
+    # A 5-per-day quota, as a small YOUTUBE_QUOTA_PER_DAY would configure
+    limiter = RateLimiter(tokens_per_second=5 / 86400, max_tokens=5)
+
+    for _ in range(5):
+        assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+
+    assert limiter.acquire()
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(86400 / 5, rel=0.01)
+
+
+def test_rate_below_fixed_point_resolution_still_refills(sleeps):
+    limiter = RateLimiter(tokens_per_second=1e-12, max_tokens=1)
+    assert limiter._rate_fp >= 1
+
+    assert limiter.acquire(blocking=False)
+    assert limiter.acquire()
+    assert sleeps and 0 < sleeps[0] < float("inf")
+
+
+class FakeClock:
+    """Stand-in for time.monotonic_ns that only moves when told to."""
+
+    def __init__(self):
+        self.ns = 10**12
+
+    def __call__(self) -> int:
+        return self.ns
+
+    def advance(self, seconds: float):
+        self.ns += int(seconds * 1e9)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic_ns", fake)
+    return fake
+
+
+def test_burst_up_to_capacity_without_waiting(clock, sleeps):
+    limiter = RateLimiter(tokens_per_second=10, max_tokens=3)
+
+    for _ in range(3):
+        assert limiter.acquire()
+
+    assert sleeps == []
+    assert limiter.tokens == pytest.approx(0)
+
+
+def test_non_blocking_failure_consumes_nothing(clock, sleeps):
+    limiter = RateLimiter(tokens_per_second=10, max_tokens=1)
+    assert limiter.acquire(blocking=False)
+
+    clock.advance(0.05)
+    assert not limiter.acquire(blocking=False)
+    assert limiter.tokens == pytest.approx(0.5)
+
+    clock.advance(0.05)
+    assert limiter.acquire(blocking=False)
+    assert sleeps == []
+
+
+def test_blocking_callers_queue_behind_debt(clock, sleeps):
+    limiter = RateLimiter(tokens_per_second=10, max_tokens=1)
+    assert limiter.acquire()
+
+    # Each waiter reserves its token up front, leaving the bucket in debt
+    assert limiter.acquire()
+    assert limiter.tokens == pytest.approx(-1)
+    assert limiter.acquire()
+    assert limiter.tokens == pytest.approx(-2)
+
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    # Debt is repaid by refill before new tokens become available
+    clock.advance(0.3)
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+
+
+def test_multi_token_acquire_waits_for_shortfall(clock, sleeps):
+    limiter = RateLimiter(tokens_per_second=100, max_tokens=100)
+    assert limiter.acquire(60)
+
+    assert limiter.acquire(100)
+    assert sleeps == [pytest.approx(0.6)]
+
+
+def test_refill_capped_at_capacity(clock, sleeps):
+    limiter = RateLimiter(tokens_per_second=10, max_tokens=2)
+    assert limiter.acquire(2)
+
+    clock.advance(3600)
+    assert limiter.acquire(blocking=False)
+    assert limiter.tokens == pytest.approx(1)